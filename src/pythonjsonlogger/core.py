@@ -119,7 +119,7 @@ def merge_record_extra(
         rename_fields = {}
     for key, value in record.__dict__.items():
         # this allows to have numeric keys
-        if key not in reserved and not (hasattr(key, "startswith") and key.startswith("_")):
+        if key not in reserved and not (isinstance(key, str) and key.startswith("_")):
             target[rename_fields.get(key, key)] = value
     return target
 
@@ -216,8 +216,12 @@ class BaseJsonFormatter(logging.Formatter):
         self.timestamp = timestamp
 
         self._required_fields = self.parse()
-        self._skip_fields = set(self._required_fields)
-        self._skip_fields.update(self.reserved_attrs)
+        self._has_asctime = "asctime" in self._required_fields
+        # Avoid formatting the message (msg % args) when it won't be in the output
+        self._needs_message = (
+            "message" in self._required_fields or "message" not in self.reserved_attrs
+        )
+        self._skip_fields = frozenset(self._required_fields).union(self.reserved_attrs)
         self.defaults = defaults if defaults is not None else {}
         return
 
@@ -233,24 +237,27 @@ class BaseJsonFormatter(logging.Formatter):
         if isinstance(record.msg, dict):
             message_dict = record.msg
             record.message = ""
-        else:
+        elif self._needs_message:
             record.message = record.getMessage()
 
         # only format time if needed
-        if "asctime" in self._required_fields:
+        if self._has_asctime:
             record.asctime = self.formatTime(record, self.datefmt)
 
-        # Display formatted exception, but allow overriding it in the
-        # user-supplied dict.
-        if record.exc_info and not message_dict.get("exc_info"):
-            message_dict["exc_info"] = self.formatException(record.exc_info)
-        if not message_dict.get("exc_info") and record.exc_text:
-            message_dict["exc_info"] = record.exc_text
-
-        # Display formatted record of stack frames
-        # default format is a string returned from :func:`traceback.print_stack`
-        if record.stack_info and not message_dict.get("stack_info"):
-            message_dict["stack_info"] = self.formatStack(record.stack_info)
+        # Most records have no exception or stack information so we can skip
+        # checking the individual cases.
+        if record.exc_info or record.exc_text or record.stack_info:
+            # Display formatted exception, but allow overriding it in the
+            # user-supplied dict.
+            if record.exc_info and not message_dict.get("exc_info"):
+                message_dict["exc_info"] = self.formatException(record.exc_info)
+            if not message_dict.get("exc_info") and record.exc_text:
+                message_dict["exc_info"] = record.exc_text
+
+            # Display formatted record of stack frames
+            # default format is a string returned from :func:`traceback.print_stack`
+            if record.stack_info and not message_dict.get("stack_info"):
+                message_dict["stack_info"] = self.formatStack(record.stack_info)
 
         log_record: LogRecord = {}
         self.add_fields(log_record, record, message_dict)
@@ -314,15 +321,15 @@ class BaseJsonFormatter(logging.Formatter):
             message_dict: dictionary that was logged instead of a message. e.g
                 `logger.info({"is_this_message_dict": True})`
         """
-        for field in self.defaults:
-            log_record[self._get_rename(field)] = self.defaults[field]
+        self._add_renamed_fields(log_record, self.defaults)
 
+        get_rename = self._get_rename
+        record_dict = record.__dict__
         for field in self._required_fields:
-            log_record[self._get_rename(field)] = record.__dict__.get(field)
+            log_record[get_rename(field)] = record_dict.get(field)
 
-        for data_dict in [self.static_fields, message_dict]:
-            for key, value in data_dict.items():
-                log_record[self._get_rename(key)] = value
+        self._add_renamed_fields(log_record, self.static_fields)
+        self._add_renamed_fields(log_record, message_dict)
 
         merge_record_extra(
             record,
@@ -346,6 +353,16 @@ class BaseJsonFormatter(logging.Formatter):
     def _get_rename(self, key: str) -> str:
         return self.rename_fields.get(key, key)
 
+    def _add_renamed_fields(self, log_record: Dict[str, Any], fields: Dict[str, Any]) -> None:
+        if not self.rename_fields:
+            # Nothing to rename so we can add all fields in a single update
+            log_record.update(fields)
+            return
+
+        for key, value in fields.items():
+            log_record[self._get_rename(key)] = value
+        return
+
     # Child Methods
     # ..........................................................................
     def jsonify_log_record(self, log_record: LogRecord) -> str:
@@ -80,10 +80,16 @@ def use_dataclass_default(obj: Any) -> bool:
 def dataclass_default(obj) -> dict[str, Any]:
     """Default function for dataclass instances
 
+    Only the top level dataclass is converted to a `dict`, nested values are left
+    for the encoder to handle.
+
     Args:
         obj: object to handle
+
+    *Changed in 3.3*: no longer uses `dataclasses.asdict` as it recursively copies
+    all values.
     """
-    return dataclasses.asdict(obj)
+    return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
 
 
 ## Dates and Times
@@ -94,10 +94,23 @@ class JsonFormatter(core.BaseJsonFormatter):
         self.json_ensure_ascii = json_ensure_ascii
         if not self.json_encoder and not self.json_default:
             self.json_encoder = JsonEncoder
+
+        # json.dumps constructs a new encoder on every call, when using it with one of the
+        # stateless stock encoders we instead reuse an encoder that is only recreated if the
+        # encoding options change. Custom encoders still get a new instance for every record.
+        self._encoder: Optional[json.JSONEncoder] = None
+        self._encoder_options: Optional[tuple] = None
         return
 
     def jsonify_log_record(self, log_record: core.LogRecord) -> str:
         """Returns a json string of the log record."""
+        if self.json_serializer is json.dumps and self.json_encoder in (
+            None,
+            JsonEncoder,
+            json.JSONEncoder,
+        ):
+            return self._get_encoder().encode(log_record)
+
         return self.json_serializer(
             log_record,
             default=self.json_default,
@@ -106,6 +119,23 @@ class JsonFormatter(core.BaseJsonFormatter):
             ensure_ascii=self.json_ensure_ascii,
         )
 
+    def _get_encoder(self) -> json.JSONEncoder:
+        options = (self.json_encoder, self.json_default, self.json_indent, self.json_ensure_ascii)
+        if self._encoder is None or options != self._encoder_options:
+            # Arguments match those passed by json.dumps
+            self._encoder = (self.json_encoder or json.JSONEncoder)(
+                skipkeys=False,
+                ensure_ascii=self.json_ensure_ascii,
+                check_circular=True,
+                allow_nan=True,
+                indent=self.json_indent,
+                separators=None,
+                default=self.json_default,
+                sort_keys=False,
+            )
+            self._encoder_options = options
+        return self._encoder
+
 
 ### DEPRECATED COMPATIBILITY
 ### ============================================================================
@@ -19,6 +19,11 @@ from .utils import package_is_available
 package_is_available("orjson", throw_error=True)
 import orjson  # pylint: disable=wrong-import-position,wrong-import-order
 
+### CONSTANTS
+### ============================================================================
+_OPTION = orjson.OPT_NON_STR_KEYS
+_OPTION_INDENT = _OPTION | orjson.OPT_INDENT_2
+
 
 ### FUNCTIONS
 ### ============================================================================
@@ -64,8 +69,5 @@ class OrjsonFormatter(core.BaseJsonFormatter):
 
     def jsonify_log_record(self, log_record: core.LogRecord) -> str:
         """Returns a json string of the log record."""
-        opt = orjson.OPT_NON_STR_KEYS
-        if self.json_indent:
-            opt |= orjson.OPT_INDENT_2
-
+        opt = _OPTION_INDENT if self.json_indent else _OPTION
         return orjson.dumps(log_record, default=self.json_default, option=opt).decode("utf8")
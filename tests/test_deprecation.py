@@ -17,13 +17,13 @@ import pythonjsonlogger
 ### TESTS
 ### ============================================================================
 def test_jsonlogger_deprecated():
-    with pytest.deprecated_call():
+    with pytest.warns(DeprecationWarning, match="pythonjsonlogger.jsonlogger"):
         import pythonjsonlogger.jsonlogger
     return
 
 
 def test_jsonlogger_reserved_attrs_deprecated():
-    with pytest.deprecated_call():
+    with pytest.warns(DeprecationWarning, match="RESERVED_ATTRS"):
         # Note: We use json instead of jsonlogger as jsonlogger will also produce
         # a DeprecationWarning and we specifically want the one for RESERVED_ATTRS
         pythonjsonlogger.json.RESERVED_ATTRS
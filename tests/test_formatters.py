@@ -8,12 +8,14 @@ from dataclasses import dataclass
 import datetime
 import enum
 import io
+import itertools
 import json
 import logging
 import sys
+import time
 import traceback
 from types import TracebackType
-from typing import Any, Generator
+from typing import Any, Generator, Iterable
 import uuid
 
 if sys.version_info >= (3, 9):
@@ -22,14 +24,13 @@ else:
     from backports import zoneinfo
 
 ## Installed
-import freezegun
 import pytest
 
 ## Application
 import pythonjsonlogger
 import pythonjsonlogger.defaults
 from pythonjsonlogger.core import RESERVED_ATTRS, BaseJsonFormatter, merge_record_extra
-from pythonjsonlogger.json import JsonFormatter
+from pythonjsonlogger.json import JsonEncoder, JsonFormatter
 
 if pythonjsonlogger.ORJSON_AVAILABLE:
     from pythonjsonlogger.orjson import OrjsonFormatter
@@ -39,13 +40,13 @@ if pythonjsonlogger.MSGSPEC_AVAILABLE:
 
 ### SETUP
 ### ============================================================================
-ALL_FORMATTERS: list[type[BaseJsonFormatter]] = [JsonFormatter]
+ALL_FORMATTERS: tuple[type[BaseJsonFormatter], ...] = (JsonFormatter,)
 if pythonjsonlogger.ORJSON_AVAILABLE:
-    ALL_FORMATTERS.append(OrjsonFormatter)
+    ALL_FORMATTERS += (OrjsonFormatter,)
 if pythonjsonlogger.MSGSPEC_AVAILABLE:
-    ALL_FORMATTERS.append(MsgspecFormatter)
+    ALL_FORMATTERS += (MsgspecFormatter,)
 
-_LOGGER_COUNT = 0
+_LOGGER_COUNT = itertools.count(1)
 
 
 @dataclass
@@ -64,9 +65,7 @@ class LoggingEnvironment:
 
 @pytest.fixture
 def env() -> Generator[LoggingEnvironment, None, None]:
-    global _LOGGER_COUNT  # pylint: disable=global-statement
-    _LOGGER_COUNT += 1
-    logger = logging.getLogger(f"pythonjsonlogger.tests.{_LOGGER_COUNT}")
+    logger = logging.getLogger(f"pythonjsonlogger.tests.{next(_LOGGER_COUNT)}")
     logger.setLevel(logging.DEBUG)
     buffer = io.StringIO()
     handler = logging.StreamHandler(buffer)
@@ -96,6 +95,16 @@ class SomeClass:
         return
 
 
+class CountingStr:
+    def __init__(self) -> None:
+        self.count = 0
+        return
+
+    def __str__(self) -> str:
+        self.count += 1
+        return "counting"
+
+
 class BrokenClass:
     def __str__(self) -> str:
         raise ValueError("hahah sucker")
@@ -111,6 +120,12 @@ class SomeDataclass:
     junk: bool
 
 
+@dataclass
+class OuterDataclass:
+    inner: SomeDataclass
+    items: list[SomeDataclass]
+
+
 try:
     raise ValueError
 except ValueError as e:
@@ -129,15 +144,59 @@ class MultiEnum(enum.Enum):
 NO_TEST = object()  # Sentinal
 
 
+def percent_format(keys: Iterable[str]) -> str:
+    return " ".join(f"%({key})s" for key in keys)
+
+
+SUPPORTED_KEYS = [
+    "asctime",
+    "created",
+    "filename",
+    "funcName",
+    "levelname",
+    "levelno",
+    "lineno",
+    "module",
+    "msecs",
+    "message",
+    "name",
+    "pathname",
+    "process",
+    "processName",
+    "relativeCreated",
+    "thread",
+    "threadName",
+]
+
+SUPPORTED_KEYS_FORMAT = percent_format(SUPPORTED_KEYS)
+
+RESERVED_ATTRS_MAP = {
+    "exc_info": "error.type",
+    "exc_text": "error.message",
+    "funcName": "log.origin.function",
+    "levelname": "log.level",
+    "module": "log.origin.file.name",
+    "processName": "process.name",
+    "threadName": "process.thread.name",
+    "msg": "log.message",
+}
+
+RESERVED_ATTRS_MAP_FORMAT = percent_format(RESERVED_ATTRS_MAP)
+
+RESERVED_ATTRS_NOT_MAPPED = [attr for attr in RESERVED_ATTRS if attr not in RESERVED_ATTRS_MAP]
+
+
 ### TESTS
 ### ============================================================================
 def test_merge_record_extra():
     record = logging.LogRecord(
         "name", level=1, pathname="", lineno=1, msg="Some message", args=None, exc_info=None
     )
+    record._private = "hidden"  # type: ignore[attr-defined]
     output = merge_record_extra(record, target={"foo": "bar"}, reserved=[])
     assert output["foo"] == "bar"
     assert output["msg"] == "Some message"
+    assert "_private" not in output
     return
 
 
@@ -274,6 +333,20 @@ def test_rename_once(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
     return
 
 
+@pytest.mark.parametrize("class_", ALL_FORMATTERS)
+def test_rename_fields_changed_after_init(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
+    formatter = class_("%(levelname)s %(message)s")
+    formatter.rename_fields["levelname"] = "LEVEL"
+    env.set_formatter(formatter)
+
+    env.logger.info("testing rename after init")
+    log_json = env.load_json()
+
+    assert log_json["LEVEL"] == "INFO"
+    assert "levelname" not in log_json
+    return
+
+
 @pytest.mark.parametrize("class_", ALL_FORMATTERS)
 def test_add_static_fields(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
     env.set_formatter(class_(static_fields={"log_stream": "kafka"}))
@@ -288,46 +361,83 @@ def test_add_static_fields(env: LoggingEnvironment, class_: type[BaseJsonFormatt
 
 
 @pytest.mark.parametrize("class_", ALL_FORMATTERS)
-def test_format_keys(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
-    supported_keys = [
-        "asctime",
-        "created",
-        "filename",
-        "funcName",
-        "levelname",
-        "levelno",
-        "lineno",
-        "module",
-        "msecs",
-        "message",
-        "name",
-        "pathname",
-        "process",
-        "processName",
-        "relativeCreated",
-        "thread",
-        "threadName",
-    ]
+def test_fields_changed_after_init(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
+    formatter = class_()
+    formatter.static_fields["env"] = "prod"
+    formatter.defaults["region"] = "apac"
+    env.set_formatter(formatter)
+
+    env.logger.info("testing fields after init")
+    log_json = env.load_json()
 
-    log_format = lambda x: [f"%({i:s})s" for i in x]
-    custom_format = " ".join(log_format(supported_keys))
+    assert log_json["env"] == "prod"
+    assert log_json["region"] == "apac"
+    return
 
-    env.set_formatter(class_(custom_format))
+
+@pytest.mark.parametrize("class_", ALL_FORMATTERS)
+def test_format_keys(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
+    env.set_formatter(class_(SUPPORTED_KEYS_FORMAT))
 
     msg = "testing logging format"
     env.logger.info(msg)
     log_json = env.load_json()
 
-    for key in supported_keys:
+    for key in SUPPORTED_KEYS:
         assert key in log_json
     return
 
 
 @pytest.mark.parametrize("class_", ALL_FORMATTERS)
-def test_unknown_format_key(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
-    env.set_formatter(class_("%(unknown_key)s %(message)s"))
-    env.logger.info("testing unknown logging format")
-    # make sure no error occurs
+def test_unknown_format_key(class_: type[BaseJsonFormatter]):
+    # Note: we format the record directly as handlers catch and report errors
+    # raised while formatting instead of raising them.
+    record = logging.makeLogRecord({"msg": "testing unknown logging format"})
+    log_json = json.loads(class_("%(unknown_key)s %(message)s").format(record))
+
+    assert log_json["unknown_key"] is None
+    assert log_json["message"] == "testing unknown logging format"
+    return
+
+
+@pytest.mark.parametrize("class_", ALL_FORMATTERS)
+def test_message_not_formatted_when_unused(class_: type[BaseJsonFormatter]):
+    # Note: we format the record directly as other handlers (e.g. pytest's) would
+    # also format the message.
+    arg = CountingStr()
+    record = logging.LogRecord(
+        "name",
+        level=logging.INFO,
+        pathname="",
+        lineno=1,
+        msg="hello %s",
+        args=(arg,),
+        exc_info=None,
+    )
+    log_json = json.loads(class_("%(levelname)s").format(record))
+
+    assert "message" not in log_json
+    assert arg.count == 0
+    return
+
+
+@pytest.mark.parametrize("class_", ALL_FORMATTERS)
+def test_message_unused_does_not_change_record(class_: type[BaseJsonFormatter]):
+    # Note: the record is shared between handlers, so one that has already formatted it
+    # (e.g. pytest's) must still see the formatted message after ours runs.
+    record = logging.LogRecord(
+        "name",
+        level=logging.INFO,
+        pathname="",
+        lineno=1,
+        msg="hello %s",
+        args=("world",),
+        exc_info=None,
+    )
+    logging.Formatter().format(record)
+    class_("%(levelname)s").format(record)
+
+    assert record.message == "hello world"
     return
 
 
@@ -457,57 +567,56 @@ def test_custom_object_serialization(env: LoggingEnvironment, class_: type[BaseJ
 
 @pytest.mark.parametrize("class_", ALL_FORMATTERS)
 def test_rename_reserved_attrs(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
-    log_format = lambda x: [f"%({i:s})s" for i in x]
-    reserved_attrs_map = {
-        "exc_info": "error.type",
-        "exc_text": "error.message",
-        "funcName": "log.origin.function",
-        "levelname": "log.level",
-        "module": "log.origin.file.name",
-        "processName": "process.name",
-        "threadName": "process.thread.name",
-        "msg": "log.message",
-    }
-
-    custom_format = " ".join(log_format(reserved_attrs_map.keys()))
-    reserved_attrs = [
-        attr for attr in RESERVED_ATTRS if attr not in list(reserved_attrs_map.keys())
-    ]
     env.set_formatter(
-        class_(custom_format, reserved_attrs=reserved_attrs, rename_fields=reserved_attrs_map)
+        class_(
+            RESERVED_ATTRS_MAP_FORMAT,
+            reserved_attrs=RESERVED_ATTRS_NOT_MAPPED,
+            rename_fields=RESERVED_ATTRS_MAP,
+        )
     )
 
     env.logger.info("message")
     log_json = env.load_json()
 
-    for old_name, new_name in reserved_attrs_map.items():
+    for old_name, new_name in RESERVED_ATTRS_MAP.items():
         assert new_name in log_json
         assert old_name not in log_json
     return
 
 
-@freezegun.freeze_time(datetime.datetime(2017, 7, 14, 2, 40))
 @pytest.mark.parametrize("class_", ALL_FORMATTERS)
-def test_default_encoder_with_timestamp(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
-    if (pythonjsonlogger.ORJSON_AVAILABLE and class_ is OrjsonFormatter) or (
-        pythonjsonlogger.MSGSPEC_AVAILABLE and class_ is MsgspecFormatter
-    ):
-        # FakeDatetime not supported
-        # https://github.com/ijl/orjson/issues/481
-        # https://github.com/jcrist/msgspec/issues/678
-        def json_default(obj: Any) -> Any:
-            if isinstance(obj, freezegun.api.FakeDate):
-                return obj.isoformat()
-            raise ValueError(f"Unexpected object: {obj!r}")
-
-        env.set_formatter(class_(timestamp=True, json_default=json_default))  # type: ignore[call-arg]
+def test_default_encoder_with_timestamp(
+    env: LoggingEnvironment, class_: type[BaseJsonFormatter], monkeypatch: pytest.MonkeyPatch
+):
+    # Note: LogRecord uses time.time_ns from Python 3.13, time.time before that
+    timestamp = datetime.datetime(2017, 7, 14, 2, 40, tzinfo=datetime.timezone.utc).timestamp()
+    monkeypatch.setattr(time, "time", lambda: timestamp)
+    monkeypatch.setattr(time, "time_ns", lambda: int(timestamp) * 1_000_000_000)
+
+    env.set_formatter(class_(timestamp=True))
+
+    env.logger.info("Hello")
+    log_json = env.load_json()
+
+    if pythonjsonlogger.MSGSPEC_AVAILABLE and class_ is MsgspecFormatter:
+        # msgspec encodes UTC as "Z"
+        assert log_json["timestamp"] == "2017-07-14T02:40:00Z"
     else:
-        env.set_formatter(class_(timestamp=True))
+        assert log_json["timestamp"] == "2017-07-14T02:40:00+00:00"
+    return
+
+
+@pytest.mark.parametrize("class_", ALL_FORMATTERS)
+def test_timestamp_changed_after_init(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
+    formatter = class_(timestamp=True)
+    formatter.timestamp = "ts"
+    env.set_formatter(formatter)
 
     env.logger.info("Hello")
     log_json = env.load_json()
 
-    assert log_json["timestamp"] == "2017-07-14T02:40:00+00:00"
+    assert "ts" in log_json
+    assert "timestamp" not in log_json
     return
 
 
@@ -601,6 +710,19 @@ def test_common_types_encoded(
     return
 
 
+@pytest.mark.parametrize("class_", ALL_FORMATTERS)
+def test_nested_dataclass_encoded(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
+    env.set_formatter(class_())
+
+    inner = SomeDataclass(things="inner", stuff=1, junk=True)
+    env.logger.info("hello", extra={"extra": OuterDataclass(inner=inner, items=[inner])})
+    log_json = env.load_json()
+
+    expected_inner = {"things": "inner", "stuff": 1, "junk": True}
+    assert log_json["extra"] == {"inner": expected_inner, "items": [expected_inner]}
+    return
+
+
 @pytest.mark.parametrize("class_", ALL_FORMATTERS)
 def test_custom_default(env: LoggingEnvironment, class_: type[BaseJsonFormatter]):
     def custom_default(obj):
@@ -623,8 +745,7 @@ def test_json_ensure_ascii_true(env: LoggingEnvironment):
     env.logger.info("Привет")
 
     # Note: we don't use env.load_json as we want to know the raw output
-    msg = env.buffer.getvalue().split('"message": "', 1)[1].split('"', 1)[0]
-    assert msg == r"\u041f\u0440\u0438\u0432\u0435\u0442"
+    assert r'"message": "\u041f\u0440\u0438\u0432\u0435\u0442"' in env.buffer.getvalue()
     return
 
 
@@ -633,6 +754,88 @@ def test_json_ensure_ascii_false(env: LoggingEnvironment):
     env.logger.info("Привет")
 
     # Note: we don't use env.load_json as we want to know the raw output
-    msg = env.buffer.getvalue().split('"message": "', 1)[1].split('"', 1)[0]
-    assert msg == "Привет"
+    assert '"message": "Привет"' in env.buffer.getvalue()
+    return
+
+
+def test_json_custom_serializer(env: LoggingEnvironment):
+    def serializer(obj: Any, **kwargs: Any) -> str:
+        return json.dumps({"wrapped": obj}, **kwargs)
+
+    env.set_formatter(JsonFormatter(json_serializer=serializer))
+    env.logger.info("hello")
+    log_json = env.load_json()
+
+    assert log_json["wrapped"]["message"] == "hello"
     return
+
+
+def test_json_attributes_changed_after_init(env: LoggingEnvironment):
+    formatter = JsonFormatter()
+    env.set_formatter(formatter)
+    env.logger.info("hello")
+
+    formatter.json_indent = 2
+    env.logger.info("hello")
+
+    formatter.json_serializer = lambda *args, **kwargs: '{"custom": true}'
+    env.logger.info("hello")
+
+    output = env.buffer.getvalue()
+    assert output == '{"message": "hello"}\n{\n  "message": "hello"\n}\n{"custom": true}\n'
+    return
+
+
+def test_json_custom_encoder_receives_all_kwargs(env: LoggingEnvironment):
+    class CustomEncoder(JsonEncoder):
+        def __init__(self, *, sort_keys: bool, **kwargs: Any) -> None:
+            super().__init__(sort_keys=True, **kwargs)
+            return
+
+    env.set_formatter(JsonFormatter("%(name)s %(message)s", json_encoder=CustomEncoder))
+    env.logger.info("hello")
+
+    assert env.buffer.getvalue().startswith('{"message": "hello"')
+    return
+
+
+def test_json_custom_encoder_not_reused(env: LoggingEnvironment):
+    class CustomEncoder(JsonEncoder):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            self.count = 0
+            return
+
+        def default(self, o: Any) -> Any:
+            self.count += 1
+            return self.count
+
+    env.set_formatter(JsonFormatter(json_encoder=CustomEncoder))
+    env.logger.info("hello", extra={"thing": object()})
+    env.logger.info("hello", extra={"thing": object()})
+
+    lines = env.buffer.getvalue().splitlines()
+    assert [json.loads(line)["thing"] for line in lines] == [1, 1]
+    return
+
+
+## OrjsonFormatter Specific
+## -----------------------------------------------------------------------------
+if pythonjsonlogger.ORJSON_AVAILABLE:
+
+    def test_orjson_indent(env: LoggingEnvironment):
+        env.set_formatter(OrjsonFormatter(json_indent=True))
+        env.logger.info("hello")
+
+        assert env.buffer.getvalue().startswith('{\n  "message": "hello"')
+        assert env.load_json()["message"] == "hello"
+        return
+
+    def test_orjson_indent_changed_after_init(env: LoggingEnvironment):
+        formatter = OrjsonFormatter()
+        formatter.json_indent = True
+        env.set_formatter(formatter)
+        env.logger.info("hello")
+
+        assert env.buffer.getvalue().startswith('{\n  "message": "hello"')
+        return